@@ -1,42 +1,117 @@
-import asyncio, json, websockets
+import asyncio, json, threading, websockets
+from websockets.exceptions import InvalidHandshake
 
 quit_key = 'q'
 #normalize strings
 ROOM_ID = input("Room ID: ").strip()
 USERNAME = input("Username: ").strip()
 
+#waiting for a server that is not up yet (or still draining) -> wait a bit longer every try
+MAX_RECONNECT_DELAY_MS = 10000
+
+def backoff(delay_ms):
+    return min(max(delay_ms * 2, 500), MAX_RECONNECT_DELAY_MS)
+
 async def run():
     uri = "ws://127.0.0.1:8003/ws"
 
-    #with handles error and sizing automatically
-    async with websockets.connect(uri) as ws:
-        await ws.send(json.dumps({"command":"JOIN_ROOM","roomId":ROOM_ID,"username":USERNAME}))
-        print(f"Joined. Type moves as 0..8. Type '{quit_key}' to quit.")
+    #one reader for the keyboard for the whole session
+    #input() blocks -> run it in a daemon thread so we still receive while typing
+    #(daemon: quitting doesn't wait for one more Enter)
+    loop = asyncio.get_running_loop()
+    lines = asyncio.Queue()
 
-        async def receiver():
+    def read_input():
+        while True:
             try:
-                while True:
-                    #wait for a message from the other end
-                    message = await ws.recv()
-                    #indicate it's coming from server
-                    print("<--", message)
-            except:
-                #avoid errors, maybe will handle later
-                pass
-
-        async def sender():
-            while True:
-                #indicate we're talking about a game move
-                s = input("> ")
-
-                if s.lower == quit_key:
+                line = input("> ")
+            except EOFError:
+                #stdin closed (Ctrl+D / end of a pipe) -> same as quitting
+                line = quit_key
+            try:
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+            except RuntimeError:
+                #event loop already closed, we are shutting down
+                return
+            if line.lower() == quit_key:
+                return
+
+    threading.Thread(target=read_input, daemon=True).start()
+    print(f"Type moves as 0..8. Type '{quit_key}' to quit.")
+
+    reconnect_after_ms = None
+
+    while True:
+        try:
+            #with handles error and sizing automatically
+            async with websockets.connect(uri) as ws:
+                #(re)join the room every time we connect
+                await ws.send(json.dumps({"command":"JOIN_ROOM","roomId":ROOM_ID,"username":USERNAME}))
+                print("Connected.")
+
+                async def receiver():
+                    nonlocal reconnect_after_ms
+                    try:
+                        while True:
+                            #wait for a message from the other end
+                            message = await ws.recv()
+                            #indicate it's coming from server
+                            print("<--", message)
+
+                            data = json.loads(message)
+
+                            #back in the room -> next RECONNECT starts fresh
+                            if data.get("type") == "JOINED_ROOM":
+                                reconnect_after_ms = None
+
+                            #server is restarting -> come back after the delay it asked for
+                            #asked again before we got back in -> keep backing off
+                            if data.get("type") == "RECONNECT":
+                                asked_ms = data.get("retryAfterMs", 1000)
+                                if reconnect_after_ms is not None:
+                                    asked_ms = max(asked_ms, backoff(reconnect_after_ms))
+                                reconnect_after_ms = asked_ms
+                                return
+                    except Exception:
+                        #avoid errors, maybe will handle later
+                        pass
+
+                async def sender():
+                    while True:
+                        #indicate we're talking about a game move
+                        s = await lines.get()
+
+                        if s.lower() == quit_key:
+                            return
+
+                        if s.isdigit():
+                            await ws.send(json.dumps({"command": "MAKE_MOVE", "roomId": ROOM_ID,
+                                                      "username": USERNAME, "cell": int(s)}))
+
+                #make sure both happen at the same time
+                #without asyncio my program was waiting indefinetly
+                receiver_task = asyncio.create_task(receiver())
+                sender_task = asyncio.create_task(sender())
+                done, pending = await asyncio.wait({receiver_task, sender_task}, return_when=asyncio.FIRST_COMPLETED)
+                for task in pending:
+                    task.cancel()
+
+                #user typed quit
+                if sender_task in done:
                     break
+        #not up yet (refused) / still starting or draining (handshake rejected, e.g. 403 / 503)
+        except (OSError, InvalidHandshake):
+            #only retry if we were asked to reconnect
+            if reconnect_after_ms is None:
+                raise
+            reconnect_after_ms = backoff(reconnect_after_ms)
+
+        #socket closed without a RECONNECT -> we are done
+        if reconnect_after_ms is None:
+            print("Connection closed.")
+            break
 
-                if s.isdigit():
-                    await ws.send(json.dumps({"command": "MAKE_MOVE", "roomId": ROOM_ID,
-                                              "username": USERNAME, "cell": int(s)}))
-                    #make sure both happen at the same time
-                    #without asyncio my program was waiting indefinetly
-                    await asyncio.gather(receiver(), sender())
+        print(f"Server restarting, reconnecting in {reconnect_after_ms} ms")
+        await asyncio.sleep(reconnect_after_ms / 1000)
 
-asyncio.run(run())
\ No newline at end of file
+asyncio.run(run())
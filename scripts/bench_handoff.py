@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+import random
+import tempfile
+
+#measure how long a game-service restart handoff takes for N live matches
+#serialize -> file write/read and socket transfer -> restore, like /admin/drain + startup
+#usage: bench_handoff.py [number_of_matches]   (default 100000)
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "services", "game-service"))
+import main as game
+
+def fill_matches(count):
+    for i in range(count):
+        match_id = f"MATCH_{i:08x}"
+        room_id = f"ROOM_{i:06x}"
+        players = [f"p{i}a", f"p{i}b"]
+
+        #half played boards so the snapshot looks like real traffic
+        board = [random.choice(["", "", "X", "O"]) for _ in range(9)]
+
+        game.matches[match_id] = {
+            "roomId":   room_id,
+            "players":  players,
+            "board":    board,
+            "turn":     players[i % 2],
+            "status":   "ACTIVE",
+            "score":    {players[0]: i % 3, players[1]: i % 2, "draws": 0},
+            "version":  i + 1
+        }
+        game.map_rooms_to_match[room_id] = {"matchId": match_id, "players": players}
+
+def ms(seconds):
+    return seconds * 1000
+
+def main(count=100000):
+    fill_matches(count)
+    before = dict(game.matches)
+
+    started = time.perf_counter()
+    data = game.build_snapshot()
+    serialize = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as folder:
+        #file handoff: old process writes, new one reads
+        path = os.path.join(folder, "snapshot.json")
+        started = time.perf_counter()
+        game.write_snapshot_file(data, path)
+        from_file = game.read_snapshot_file(path)
+        file_transfer = time.perf_counter() - started
+
+        #socket handoff: old process serves, new one connects, reads and confirms
+        #(restore is timed on its own below, here we only keep the bytes)
+        sock_path = os.path.join(folder, "handoff.sock")
+        received = []
+        started = time.perf_counter()
+        game.serve_snapshot(data, sock_path)
+        game.receive_snapshot(sock_path, lambda payload: received.append(payload) or 1)
+        socket_transfer = time.perf_counter() - started
+        from_socket = received[0] if received else None
+
+    if from_file != data or from_socket != data:
+        print("[ERR] snapshot changed on the way")
+        sys.exit(1)
+
+    game.matches.clear()
+    game.map_rooms_to_match.clear()
+
+    started = time.perf_counter()
+    restored = game.restore_snapshot(from_socket)
+    restore = time.perf_counter() - started
+
+    if restored != count or game.matches != before:
+        print("[ERR] restored state differs from the original")
+        sys.exit(1)
+
+    print(f"[OK ] matches:          {count}")
+    print(f"[OK ] snapshot:         {len(data) / 1024 / 1024:.2f} MB")
+    print(f"[OK ] serialize:        {ms(serialize):.1f} ms")
+    print(f"[OK ] file write+read:  {ms(file_transfer):.1f} ms")
+    print(f"[OK ] socket transfer:  {ms(socket_transfer):.1f} ms")
+    print(f"[OK ] restore:          {ms(restore):.1f} ms")
+    print(f"[OK ] total via file:   {ms(serialize + file_transfer + restore):.1f} ms")
+    print(f"[OK ] total via socket: {ms(serialize + socket_transfer + restore):.1f} ms")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args:
+        main(int(args[0]))
+    else:
+        main()
@@ -56,6 +56,9 @@ def main(p1="emil", p2="sara"):
         joined = req.json()
         match_id = joined.get("matchId")
         status = joined.get("status")
+        #room-service sends back the trace of this join -> every WebSocket command
+        #gets its own trace that links back to it (see /debug/traces "links")
+        traceparent = req.headers.get("traceparent", "")
         print(f"[OK ] {p2} joined room: {room_id} | status={status} | matchId={match_id}")
     except requests.RequestException as e:
         print(f"[ERR] joining room: {e}")
@@ -64,12 +67,13 @@ def main(p1="emil", p2="sara"):
     print("\n--- Ready to play ---")
     print("Open two terminals and run:")
     print(f'  wscat -c ws://127.0.0.1:8003/ws')
-    print(f'  {{\"command\":\"JOIN_ROOM\",\"roomId\":\"{room_id}\",\"username\":\"{p1}\"}}')
+    print(f'  {{\"command\":\"JOIN_ROOM\",\"roomId\":\"{room_id}\",\"username\":\"{p1}\",\"traceparent\":\"{traceparent}\"}}')
     print()
     print(f'  wscat -c ws://127.0.0.1:8003/ws')
-    print(f'  {{\"command\":\"JOIN_ROOM\",\"roomId\":\"{room_id}\",\"username\":\"{p2}\"}}')
+    print(f'  {{\"command\":\"JOIN_ROOM\",\"roomId\":\"{room_id}\",\"username\":\"{p2}\",\"traceparent\":\"{traceparent}\"}}')
     print("\nThen make moves (cell 0-8):")
-    print(f'  {{\"command\":\"MAKE_MOVE\",\"roomId\":\"{room_id}\",\"username\":\"{p1}\",\"cell\":0}}')
+    print(f'  {{\"command\":\"MAKE_MOVE\",\"roomId\":\"{room_id}\",\"username\":\"{p1}\",\"cell\":0,\"traceparent\":\"{traceparent}\"}}')
+    print("\nSlowest flows: http://127.0.0.1:8003/debug/traces (set TRACE_SAMPLE_RATE=1 and a shared TRACE_EXPORT_FILE)")
 
 if __name__ == "__main__":
     # allow optional CLI args: bootstrap_match.py [player1] [player2]
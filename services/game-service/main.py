@@ -1,18 +1,57 @@
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List
 from uuid import uuid4
+from contextlib import asynccontextmanager, contextmanager
 import requests
 import json
+import asyncio
+import gc
+import itertools
+import os
+import random
+import signal
+import socket
+import sys
+import threading
+import time
 from json import JSONDecodeError
+from urllib.parse import parse_qs
 from starlette.websockets import WebSocketState
 
+#shared helpers live one folder up (services/)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tracing import install_tracing
+
 USER_SERVICE_URL = "http://127.0.0.1:8001"
 
-app = FastAPI()
+#restart handoff: the old process leaves its matches here, the new one picks them up
+GAME_SNAPSHOT_FILE = os.environ.get("GAME_SNAPSHOT_FILE")
+GAME_HANDOFF_SOCKET = os.environ.get("GAME_HANDOFF_SOCKET")
+
+#load the previous process' matches before we accept any traffic
+#(load_snapshot is further down, it only runs once the module is ready)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    load_snapshot()
+    yield
+
+#long-polls and SSE streams stay open on purpose -> keep them out of the traces
+def is_waiting_request(scope: dict) -> bool:
+    path = scope["path"]
+    if not path.startswith("/game/state/"):
+        return False
+    return path.endswith("/events") or "since" in parse_qs(scope.get("query_string", b"").decode("latin-1"))
 
+app = FastAPI(lifespan=lifespan)
+tracer = install_tracing(app, service="game-service", untraced=is_waiting_request)
+
+#load balancer takes us out as soon as we start draining
 @app.get("/health")
 def health_check():
+    if draining:
+        return JSONResponse(status_code=503, content={"service": "game-service", "status": "draining"})
     return {"service": "game-service", "status": "ok"}
 
 
@@ -30,6 +69,28 @@ map_rooms_to_match: Dict[str, dict] = {}
 #roomId will list active connections
 active_connections: Dict[str, List[WebSocket]] = {}
 
+#every change to a match takes the next number from here
+#one shared counter -> a new match in the same room never goes "back in time"
+state_version_counter = itertools.count(1)
+
+#roomId -> {"event": asyncio.Event, "waiters": int}
+#pollers and SSE streams of a room wait on its event, a change only wakes that room
+#created by the first waiter, dropped on the change (or when the last waiter leaves)
+room_changed: Dict[str, dict] = {}
+
+#how long a long-poll / SSE stream waits before answering anyway
+LONG_POLL_TIMEOUT_SECONDS = 25
+SSE_KEEPALIVE_SECONDS = 15
+
+#set by /admin/drain -> no new matches / joins / moves, clients go elsewhere
+draining = False
+
+#clients get a random reconnect delay in this window so they don't all come back at once
+DRAIN_RECONNECT_SPREAD_MS = 5000
+
+#timings of the last snapshot save / load
+handoff_stats: Dict[str, dict] = {}
+
 class StartMatchRequest(BaseModel):
     roomId:     str
     players:    list[str]
@@ -37,9 +98,21 @@ class StartMatchRequest(BaseModel):
 def initiate_board(number_of_cells: int):  
     return [""] * number_of_cells
 
+#call after every change to a match -> new version + wake up the clients waiting on its room
+#must run on the event loop (asyncio.Event is not thread safe)
+def mark_match_changed(match: dict):
+    match["version"] = next(state_version_counter)
+    waiting = room_changed.pop(match["roomId"], None)
+    if waiting:
+        waiting["event"].set()
+
 #create a match object
+#async so the version bump runs on the event loop (no blocking work in here)
 @app.post("/game/start")
-def start_match(request: StartMatchRequest):
+async def start_match(request: StartMatchRequest):
+
+    if draining:
+        raise HTTPException(status_code=503, detail="Game service is draining")
 
     #initialize a match object
     match_id = "MATCH_" + uuid4().hex[:8]
@@ -58,7 +131,8 @@ def start_match(request: StartMatchRequest):
             request.players[0]: 0,
             request.players[1]: 0,
             "draws": 0,
-        }
+        },
+        "version":  0
     }
 
 
@@ -70,6 +144,8 @@ def start_match(request: StartMatchRequest):
     if request.roomId not in active_connections:
         active_connections[request.roomId] = []
 
+    mark_match_changed(matches[match_id])
+
     return {
         "matchId": match_id,
         "roomId": request.roomId,
@@ -77,12 +153,107 @@ def start_match(request: StartMatchRequest):
         "status": "STARTED"
     }
 
+def state_etag(state: dict) -> str:
+    return f'"{state["version"]}"'
+
+#If-None-Match can be `*`, a list ("4", "5") and weak (W/"5") -> weak compare per RFC 9110
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+#wait until the room has a version newer than `since` (or give up after timeout)
+async def wait_for_state_change(room_id: str, since: int, timeout: float):
+    state = get_match_state_by_room(room_id)
+    if state is not None and state["version"] > since:
+        return state
+
+    #no await between the check above and joining the waiters -> no change can slip through
+    waiting = room_changed.get(room_id)
+    if waiting is None:
+        waiting = room_changed[room_id] = {"event": asyncio.Event(), "waiters": 0}
+    waiting["waiters"] += 1
+
+    try:
+        await asyncio.wait_for(waiting["event"].wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        waiting["waiters"] -= 1
+        #nobody left and nothing changed -> don't keep an event per idle room
+        if waiting["waiters"] == 0 and room_changed.get(room_id) is waiting:
+            del room_changed[room_id]
+
+    return get_match_state_by_room(room_id)
+
+#plain GET -> full state + ETag, If-None-Match -> 304 when nothing changed
+#?since=<version> -> long-poll, answers as soon as the version moves past it
 @app.get("/game/state/{room_id}")
-def debug_state(room_id: str):
+async def debug_state(room_id: str, request: Request, since: Optional[int] = None):
     state = get_match_state_by_room(room_id)
     if not state:
         raise HTTPException(status_code=404, detail="No state")
-    return state
+
+    if since is not None and state["version"] <= since:
+        state = await wait_for_state_change(room_id, since, LONG_POLL_TIMEOUT_SECONDS)
+        if not state:
+            raise HTTPException(status_code=404, detail="No state")
+
+    etag = state_etag(state)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    #long-poll ran out of time with nothing new
+    if since is not None and state["version"] <= since:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=json.dumps(state),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+#server-sent events: one "state" event per version, comments as keep-alive
+@app.get("/game/state/{room_id}/events")
+async def state_events(room_id: str, request: Request):
+    if not get_match_state_by_room(room_id):
+        raise HTTPException(status_code=404, detail="No state")
+
+    #reconnecting EventSource sends the last id it saw
+    last_event_id = request.headers.get("last-event-id")
+    try:
+        since = int(last_event_id) if last_event_id else 0
+    except ValueError:
+        since = 0
+
+    async def event_stream():
+        nonlocal since
+        while True:
+            if draining or await request.is_disconnected():
+                break
+
+            state = await wait_for_state_change(room_id, since, SSE_KEEPALIVE_SECONDS)
+            if not state:
+                break
+            if state["version"] <= since:
+                yield ": keep-alive\n\n"
+                continue
+
+            since = state["version"]
+            yield f"id: {since}\nevent: state\ndata: {json.dumps(state)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 #message to all participants
 async def broadcast_room(room_id: str, message: dict):
@@ -120,7 +291,8 @@ def get_match_state_by_room(room_id: str):
         "board": match["board"],
         "turn": match["turn"],
         "status": match["status"],
-        "score": match["score"]
+        "score": match["score"],
+        "version": match["version"]
     }
 
 def get_match_by_room(room_id: str):
@@ -183,29 +355,370 @@ def build_board_state_message(room_id:str, match_id: str, match:dict) -> dict:
         "turn": match["turn"],
         "status": match["status"],
         "score": match["score"],
+        "version": match["version"],
     }
 
 def report_result(player1: str, player2: str, winner:str | None):
     try:
-        requests.post(
-            f"{USER_SERVICE_URL}/reportResult",
-            json={"player1": player1, "player2": player2, "winner": winner},
-            timeout=3
-        )
+        with tracer.span("call user-service /reportResult", winner=winner):
+            requests.post(
+                f"{USER_SERVICE_URL}/reportResult",
+                json={"player1": player1, "player2": player2, "winner": winner},
+                headers=tracer.inject(),
+                timeout=3
+            )
     except requests.RequestException:
         pass
 
+#-------------------#
+#  DRAIN & HANDOFF  #
+#-------------------#
+
+#compact snapshot: one list per match, board as a 9 char string ("-" = empty)
+#[matchId, roomId, players, board, turn, status, [score p1, score p2, draws], version]
+SNAPSHOT_FORMAT = 1
+
+BOARD_CELL_TO_CHAR = {"": "-", "X": "X", "O": "O"}
+BOARD_CHAR_TO_CELL = {"-": "", "X": "X", "O": "O"}
+
+#100k matches = millions of new lists/strings, the GC would keep rescanning them
+#(roughly halves snapshot save and load time)
+@contextmanager
+def paused_gc():
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+def build_snapshot() -> bytes:
+    with paused_gc():
+        return build_snapshot_bytes()
+
+def build_snapshot_bytes() -> bytes:
+    to_char = BOARD_CELL_TO_CHAR
+    rows = []
+    for match_id, match in matches.items():
+        p1, p2 = match["players"][0], match["players"][1]
+        score = match["score"]
+        rows.append([
+            match_id,
+            match["roomId"],
+            match["players"],
+            "".join([to_char[cell] for cell in match["board"]]),
+            match["turn"],
+            match["status"],
+            [score[p1], score[p2], score["draws"]],
+            match["version"],
+        ])
+
+    snapshot = {
+        "format":       SNAPSHOT_FORMAT,
+        "nextVersion":  next(state_version_counter),
+        "matches":      rows,
+        "rooms":        {room_id: info["matchId"] for room_id, info in map_rooms_to_match.items()},
+    }
+    return json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+
+def restore_snapshot(data: bytes) -> int:
+    with paused_gc():
+        return restore_snapshot_bytes(data)
+
+#all or nothing: a broken snapshot raises (ValueError / KeyError / TypeError / IndexError)
+#before anything in the live data sets is touched
+def restore_snapshot_bytes(data: bytes) -> int:
+    global state_version_counter
+
+    snapshot = json.loads(data)
+    if not isinstance(snapshot, dict) or snapshot.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError("Not a game-service snapshot")
+
+    to_cell = BOARD_CHAR_TO_CELL
+    restored_matches = {}
+    for match_id, room_id, players, board, turn, status, score, version in snapshot["matches"]:
+        if len(board) != 9:
+            raise ValueError(f"Bad board in {match_id}")
+        restored_matches[match_id] = {
+            "roomId":   room_id,
+            "players":  players,
+            "board":    [to_cell[char] for char in board],
+            "turn":     turn,
+            "status":   status,
+            "score": {
+                players[0]: score[0],
+                players[1]: score[1],
+                "draws": score[2],
+            },
+            "version":  version
+        }
+
+    restored_rooms = {}
+    for room_id, match_id in snapshot["rooms"].items():
+        if match_id in restored_matches:
+            restored_rooms[room_id] = {"matchId": match_id, "players": restored_matches[match_id]["players"]}
+
+    next_version = itertools.count(int(snapshot["nextVersion"]))
+
+    #everything parsed -> now it's safe to go live with it
+    matches.update(restored_matches)
+    map_rooms_to_match.update(restored_rooms)
+    for room_id in restored_rooms:
+        active_connections.setdefault(room_id, [])
+    state_version_counter = next_version
+    return len(restored_matches)
+
+#write + rename so the new process never reads half a file
+def write_snapshot_file(data: bytes, path: str):
+    with open(path + ".tmp", "wb") as file:
+        file.write(data)
+    os.replace(path + ".tmp", path)
+
+def read_snapshot_file(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+#socket handoff, old and new process on the same port:
+#  old: send 8 byte length + snapshot, wait for "OK" (= new process restored it), then shut down -> port is free
+#  new: restore, send "OK", wait until the old process is gone, only then let uvicorn bind
+#no "OK" (new process crashed / bad data) -> old keeps waiting for the next replacement
+HANDOFF_ACK = b"OK"
+HANDOFF_ACK_TIMEOUT_SECONDS = 60
+HANDOFF_EXIT_TIMEOUT_SECONDS = 30
+
+#old process side: on_handoff runs once a replacement confirmed (drain passes "shut down")
+def serve_snapshot(data: bytes, path: str, timeout: float = 120, on_handoff: Optional[Callable[[], None]] = None):
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(path)
+        server.listen(1)
+        server.settimeout(timeout)
+    except OSError:
+        server.close()
+        raise
+
+    def close_server():
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+    def run():
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    try:
+                        conn.settimeout(HANDOFF_ACK_TIMEOUT_SECONDS)
+                        conn.sendall(len(data).to_bytes(8, "big") + data)
+                        if conn.recv(len(HANDOFF_ACK)) != HANDOFF_ACK:
+                            continue
+                    except OSError:
+                        continue
+
+                    #handed off: nobody else may take the snapshot
+                    close_server()
+                    if on_handoff is None:
+                        return
+                    on_handoff()
+                    #keep `conn` open until this process is gone,
+                    #its close (EOF) tells the replacement that the port is free
+                    threading.Event().wait()
+        except OSError:
+            #accept timed out / server closed
+            pass
+        finally:
+            close_server()
+
+    threading.Thread(target=run, name="snapshot-handoff", daemon=True).start()
+
+def receive_exactly(conn: socket.socket, size: int) -> bytes:
+    chunks, missing = [], size
+    while missing:
+        chunk = conn.recv(min(missing, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Snapshot cut off")
+        chunks.append(chunk)
+        missing -= len(chunk)
+    return b"".join(chunks)
+
+#new process side: restore() returns the number of matches or None if the data is bad
+def receive_snapshot(path: str, restore: Callable[[bytes], Optional[int]]):
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(HANDOFF_ACK_TIMEOUT_SECONDS)
+            conn.connect(path)
+            size = int.from_bytes(receive_exactly(conn, 8), "big")
+            data = receive_exactly(conn, size)
+
+            restored = restore(data)
+            if restored is None:
+                return None, 0
+
+            conn.sendall(HANDOFF_ACK)
+            #wait for the old process to exit (and give up the port)
+            conn.settimeout(HANDOFF_EXIT_TIMEOUT_SECONDS)
+            try:
+                while conn.recv(1):
+                    pass
+            except OSError:
+                print("[game-service] old process did not exit in time, starting anyway")
+            return restored, len(data)
+    except OSError:
+        return None, 0
+
+#broken / cut off snapshot -> log it and let the caller try the next source
+def try_restore(source: str, data: Optional[bytes]) -> Optional[int]:
+    if not data:
+        return None
+    try:
+        return restore_snapshot(data)
+    except (ValueError, KeyError, TypeError, IndexError) as error:
+        print(f"[game-service] ignoring {source} snapshot ({len(data)} bytes): {error!r}")
+        return None
+
+#new process side, runs on startup: socket first (old process still alive), then file
+#a bad snapshot never stops the service from starting, it just starts empty
+def load_snapshot():
+    started = time.perf_counter()
+    restored, source, size = None, None, 0
+
+    if GAME_HANDOFF_SOCKET and os.path.exists(GAME_HANDOFF_SOCKET):
+        restored, size = receive_snapshot(GAME_HANDOFF_SOCKET, lambda data: try_restore("socket", data))
+        if restored is not None:
+            source = "socket"
+
+    snapshot_file_exists = bool(GAME_SNAPSHOT_FILE) and os.path.exists(GAME_SNAPSHOT_FILE)
+
+    if restored is None and snapshot_file_exists:
+        data = read_snapshot_file(GAME_SNAPSHOT_FILE)
+        restored = try_restore("file", data)
+        if restored is not None:
+            source, size = "file", len(data)
+
+    if restored is None:
+        return
+
+    #only now the snapshot counts as used: keep it for debugging, never load it twice
+    if snapshot_file_exists:
+        os.replace(GAME_SNAPSHOT_FILE, GAME_SNAPSHOT_FILE + ".loaded")
+
+    handoff_stats["load"] = {
+        "source":   source,
+        "matches":  restored,
+        "bytes":    size,
+        "loadMs":   round((time.perf_counter() - started) * 1000, 3),
+    }
+    print(f"[game-service] restored {restored} matches from {source} in {handoff_stats['load']['loadMs']} ms")
+
+#replacement has our matches -> stop like on Ctrl+C / SIGTERM so it can take the port
+def shut_down_after_handoff():
+    handoff_stats["handedOff"] = "socket"
+    print("[game-service] snapshot handed off, shutting down")
+    os.kill(os.getpid(), signal.SIGTERM)
+
+def build_reconnect_message() -> dict:
+    return {
+        "type":         "RECONNECT",
+        "reason":       "Game service is restarting",
+        "retryAfterMs": random.randint(0, DRAIN_RECONNECT_SPREAD_MS),
+    }
+
+async def disconnect_for_drain(ws: WebSocket):
+    try:
+        await ws.send_json(build_reconnect_message())
+        #1012 = service restart
+        await ws.close(code=1012)
+    except Exception:
+        pass
+
+#one drain at a time
+drain_lock = asyncio.Lock()
+
+#idempotent: once a drain went through, a retry just reports it (and must not re-serve
+#and unlink the handoff socket); a failed drain reports the error and can be retried
+@app.post("/admin/drain")
+async def drain():
+    global draining
+    if "save" in handoff_stats:
+        return {"status": "DRAINING", **handoff_stats["save"]}
+    if drain_lock.locked():
+        raise HTTPException(status_code=409, detail="Drain already in progress")
+
+    async with drain_lock:
+        try:
+            return await run_drain()
+        except Exception as error:
+            #nothing was handed off -> keep serving as before, the operator can fix + retry
+            draining = False
+            raise HTTPException(status_code=500, detail=f"Drain failed, still serving: {error}")
+
+async def run_drain():
+    global draining
+    draining = True
+
+    #snapshot right away: from here on no command changes a match anymore,
+    #so it can be built in a worker thread while the loop keeps answering
+    def save():
+        started = time.perf_counter()
+        data = build_snapshot()
+        serialized = time.perf_counter()
+        if GAME_SNAPSHOT_FILE:
+            write_snapshot_file(data, GAME_SNAPSHOT_FILE)
+        return data, serialized - started, time.perf_counter() - serialized
+
+    data, serialize_seconds, write_seconds = await asyncio.to_thread(save)
+
+    if GAME_HANDOFF_SOCKET:
+        serve_snapshot(data, GAME_HANDOFF_SOCKET, on_handoff=shut_down_after_handoff)
+
+    #tell everyone to come back later (to the new process) and let go of the sockets
+    sockets = [ws for connections in active_connections.values() for ws in connections]
+    await asyncio.gather(*(disconnect_for_drain(ws) for ws in sockets))
+    active_connections.clear()
+
+    #wake SSE streams so they notice the drain and end
+    for waiting in room_changed.values():
+        waiting["event"].set()
+    room_changed.clear()
+
+    handoff_stats["save"] = {
+        "matches":      len(matches),
+        "bytes":        len(data),
+        "serializeMs":  round(serialize_seconds * 1000, 3),
+        "writeMs":      round(write_seconds * 1000, 3),
+        "disconnected": len(sockets),
+    }
+    return {"status": "DRAINING", **handoff_stats["save"]}
+
+@app.get("/admin/handoff")
+def handoff_status():
+    return {"draining": draining, **handoff_stats}
+
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
 
+    #draining -> refuse the handshake (403) so clients back off instead of
+    #joining, getting RECONNECT and coming straight back
+    if draining:
+        await ws.close(code=1013)
+        return
+
     #accept the connection
     await ws.accept()
 
     current_room_id = None
     current_username = None
+    command_span = None
 
     try:
         while True:
+            #previous command is done -> close its span before waiting for the next one
+            tracer.close_span(command_span)
+            command_span = None
+
             #safe check to see if the json command is correct
             #any mistyping crashed the app before
             try:
@@ -232,6 +745,16 @@ async def websocket_endpoint(ws: WebSocket):
             #data = await ws.receive_json()
             command = data.get("command")
 
+            #one trace per command (closed at the top of the loop, so also after a `continue`)
+            #a client "traceparent" (e.g. from /rooms/join) is only linked, not continued,
+            #otherwise a whole game + think time would end up in a single trace
+            command_span = tracer.open_span(f"ws {command}", link=data.get("traceparent"), roomId=data.get("roomId"))
+
+            #matches are already in the snapshot -> nothing may change them here anymore
+            if draining:
+                await ws.send_json(build_reconnect_message())
+                continue
+
             if command == "JOIN_ROOM":
                 room_id = data.get("roomId")
                 username = data.get("username")
@@ -322,12 +845,14 @@ async def websocket_endpoint(ws: WebSocket):
                 if not result:
                     p1,p2 = match["players"][0], match["players"][1]
                     match["turn"] = p2 if match["turn"] == p1 else p1
+                    mark_match_changed(match)
 
                     await broadcast_room(room_id=room_id,message=build_board_state_message(room_id,match_id,match))
 
                 elif result == "DRAW":
                     match["score"]["draws"] += 1
                     match["status"] = "ROUND_OVER"
+                    mark_match_changed(match)
                     p1,p2 = match["players"]
                     report_result(p1,p2,None)
 
@@ -337,7 +862,8 @@ async def websocket_endpoint(ws: WebSocket):
                         "matchId": match_id,
                         "result": "DRAW",
                         "board": match["board"],
-                        "score": match["score"]
+                        "score": match["score"],
+                        "version": match["version"]
                     })
                 
                 else:
@@ -348,6 +874,7 @@ async def websocket_endpoint(ws: WebSocket):
 
                     match["score"][winner_username] += 1
                     match["status"] = "ROUND_OVER"
+                    mark_match_changed(match)
                     p1,p2 = match["players"]
                     report_result(p1,p2,winner_username)
 
@@ -360,7 +887,8 @@ async def websocket_endpoint(ws: WebSocket):
                         "winner":   winner_username,
                         "loser":    loser_username,
                         "board":    match["board"],
-                        "score":    match["score"]})
+                        "score":    match["score"],
+                        "version":  match["version"]})
 
 
 
@@ -381,6 +909,13 @@ async def websocket_endpoint(ws: WebSocket):
                         "type": "PLAYER_LEFT",
                         "roomId": current_room_id,
                         "username": current_username})
+
+    except BaseException as error:
+        tracer.close_span(command_span, error=error)
+        command_span = None
+        raise
+    finally:
+        tracer.close_span(command_span)
                     
 
 
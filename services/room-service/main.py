@@ -3,9 +3,16 @@ from pydantic import BaseModel
 from typing import Optional
 from uuid import uuid4
 import requests
+import os
+import sys
+
+#shared helpers live one folder up (services/)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tracing import install_tracing
 
 
 app = FastAPI()
+tracer = install_tracing(app, service="room-service")
 
 #check if service runs
 @app.get("/health")
@@ -86,12 +93,14 @@ def join_room(req: JoinRoomRequest):
         }
 
         try:
-            response = requests.post(
-                f"{GAME_SERVICE_URL}/game/start",
-                json=start_payload,
-                timeout=5
-            )
-            response.raise_for_status()
+            with tracer.span("call game-service /game/start", roomId=room_id):
+                response = requests.post(
+                    f"{GAME_SERVICE_URL}/game/start",
+                    json=start_payload,
+                    headers=tracer.inject(),
+                    timeout=5
+                )
+                response.raise_for_status()
         except requests.RequestException as error:
             room["status"] = "ERROR_STARTING_MATCH"
             room["matchId"] = None
@@ -0,0 +1,406 @@
+#lightweight request tracing shared by user-, room- and game-service
+#
+#- trace context travels in a W3C style `traceparent` value:
+#      00-<32 hex trace id>-<16 hex span id>-<01 sampled | 00 not sampled>
+#  over HTTP as a header, over the WebSocket as a "traceparent" field in the command
+#- finished spans go into an in-process ring buffer (newest TRACE_BUFFER_SIZE kept)
+#- optional export: TRACE_EXPORT_FILE (json lines), every service writes its own file next to
+#  it (spans.jsonl -> spans.game-service.jsonl) and reads all of them back
+#  and/or TRACE_COLLECTOR_URL (spans are POSTed there in batches)
+#- GET /debug/traces  -> slowest recent flows with a per span latency breakdown
+#- GET /debug/profile -> sampling profiler, hot stacks of every thread for N seconds
+
+from fastapi import APIRouter, HTTPException
+from typing import Callable, Optional, Dict, List
+import glob
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+import requests
+
+TRACE_SAMPLE_RATE = float(os.environ.get("TRACE_SAMPLE_RATE", "0.1"))
+TRACE_BUFFER_SIZE = int(os.environ.get("TRACE_BUFFER_SIZE", "5000"))
+TRACE_EXPORT_FILE = os.environ.get("TRACE_EXPORT_FILE")
+TRACE_COLLECTOR_URL = os.environ.get("TRACE_COLLECTOR_URL")
+TRACE_EXPORT_INTERVAL_SECONDS = 1.0
+
+#a service's export file is rotated to <file>.1 past this size,
+#/debug/traces only reads the last part of each file
+TRACE_EXPORT_MAX_BYTES = int(os.environ.get("TRACE_EXPORT_MAX_BYTES", str(20 * 1024 * 1024)))
+TRACE_EXPORT_TAIL_BYTES = 4 * 1024 * 1024
+
+#upper limits for the profiler so nobody freezes a live service by accident
+PROFILE_MAX_SECONDS = 30
+PROFILE_MIN_INTERVAL_MS = 5
+
+#span that is running right now in this request / task / thread
+current_span: ContextVar[Optional[dict]] = ContextVar("current_span", default=None)
+
+
+HEX_DIGITS = set("0123456789abcdef")
+
+def is_hex(value: str, length: int) -> bool:
+    return len(value) == length and set(value) <= HEX_DIGITS
+
+#anything that is not a well formed traceparent (also non-strings from client JSON) -> None
+def parse_traceparent(value) -> Optional[dict]:
+    if not isinstance(value, str) or not value:
+        return None
+    parts = value.strip().lower().split("-")
+    if len(parts) != 4:
+        return None
+    version, trace_id, span_id, flags = parts
+    if not (is_hex(version, 2) and is_hex(trace_id, 32) and is_hex(span_id, 16) and is_hex(flags, 2)):
+        return None
+    #all zero ids are invalid by the spec
+    if version == "ff" or trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return {"traceId": trace_id, "spanId": span_id, "sampled": int(flags, 16) & 1 == 1}
+
+
+def format_traceparent(span: dict) -> str:
+    flags = "01" if span["sampled"] else "00"
+    return f"00-{span['traceId']}-{span['spanId']}-{flags}"
+
+
+#spans.jsonl + game-service -> spans.game-service.jsonl ("*" gives the glob for all services)
+def export_file_for(service: str) -> str:
+    root, extension = os.path.splitext(TRACE_EXPORT_FILE)
+    return f"{root}.{service}{extension}"
+
+#only the newest TRACE_EXPORT_TAIL_BYTES are read, so the cost stays flat
+def read_span_tail(path: str) -> List[dict]:
+    try:
+        with open(path, "rb") as file:
+            file.seek(0, os.SEEK_END)
+            start = max(file.tell() - TRACE_EXPORT_TAIL_BYTES, 0)
+            file.seek(start)
+            tail = file.read()
+    except OSError:
+        return []
+
+    lines = tail.split(b"\n")
+    #we probably started in the middle of a line
+    if start > 0:
+        lines = lines[1:]
+
+    spans = []
+    for line in lines:
+        if not line:
+            continue
+        try:
+            spans.append(json.loads(line))
+        except ValueError:
+            continue
+    return spans
+
+
+class Tracer:
+
+    def __init__(self, service: str):
+        self.service = service
+        self.spans = deque(maxlen=TRACE_BUFFER_SIZE)
+        self.lock = threading.Lock()
+
+        #spans waiting for the exporter thread
+        self.pending: List[dict] = []
+        self.exporter = None
+
+        #one profiler run at a time, it walks every stack while holding the GIL
+        self.profile_lock = threading.Lock()
+
+        #one writer per file -> rotating can't race with another service
+        self.export_file = export_file_for(self.service) if TRACE_EXPORT_FILE else None
+
+    #------------#
+    #   SPANS    #
+    #------------#
+
+    #traceparent: continue that flow (incoming request)
+    #link: start a new flow that only points back to that one, for things that happen
+    #much later than the flow that caused them (a whole game of moves after one join)
+    @contextmanager
+    def span(self, name: str, traceparent: Optional[str] = None, link: Optional[str] = None, **attributes):
+        #parent: explicit traceparent or the span we are inside
+        parent = parse_traceparent(traceparent) or current_span.get()
+        linked = parse_traceparent(link)
+
+        if parent:
+            trace_id = parent["traceId"]
+            parent_id = parent["spanId"]
+            sampled = parent["sampled"]
+        else:
+            #new flow -> decide here once, children follow the decision
+            #linked flows follow the decision of the flow they point to
+            trace_id = os.urandom(16).hex()
+            parent_id = None
+            sampled = linked["sampled"] if linked else random.random() < TRACE_SAMPLE_RATE
+
+        span = {
+            "traceId":  trace_id,
+            "spanId":   os.urandom(8).hex(),
+            "parentId": parent_id,
+            "sampled":  sampled,
+            "service":  self.service,
+            "name":     name,
+            "start":    time.time(),
+            "attributes": attributes,
+        }
+        if linked:
+            span["links"] = [linked["traceId"]]
+        started = time.perf_counter()
+        token = current_span.set(span)
+
+        try:
+            yield span
+        except BaseException as error:
+            span["error"] = repr(error)
+            raise
+        finally:
+            current_span.reset(token)
+            span["durationMs"] = round((time.perf_counter() - started) * 1000, 3)
+            if sampled:
+                self.record(span)
+
+    #same span without a `with` block, for loops that `continue` out of the traced code
+    #(close_span(None) is a no-op, so it can run before the first open_span)
+    def open_span(self, name: str, traceparent: Optional[str] = None, link: Optional[str] = None, **attributes):
+        span = self.span(name, traceparent=traceparent, link=link, **attributes)
+        span.__enter__()
+        return span
+
+    def close_span(self, span, error: Optional[BaseException] = None):
+        if span is None:
+            return
+        if error is None:
+            span.__exit__(None, None, None)
+        else:
+            span.__exit__(type(error), error, error.__traceback__)
+
+    #headers for an outbound call, continues the current flow
+    def inject(self, headers: Optional[dict] = None) -> dict:
+        headers = dict(headers or {})
+        span = current_span.get()
+        if span:
+            headers["traceparent"] = format_traceparent(span)
+        return headers
+
+    def record(self, span: dict):
+        with self.lock:
+            self.spans.append(span)
+            if TRACE_EXPORT_FILE or TRACE_COLLECTOR_URL:
+                self.pending.append(span)
+                self.start_exporter()
+
+    #------------#
+    #   EXPORT   #
+    #------------#
+
+    def start_exporter(self):
+        #called with self.lock held
+        if self.exporter is None:
+            self.exporter = threading.Thread(target=self.export_loop, name="trace-exporter", daemon=True)
+            self.exporter.start()
+
+    def export_loop(self):
+        while True:
+            time.sleep(TRACE_EXPORT_INTERVAL_SECONDS)
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            batch, self.pending = self.pending, []
+        if not batch:
+            return
+
+        if self.export_file:
+            try:
+                with open(self.export_file, "a", encoding="utf-8") as file:
+                    file.write("".join(json.dumps(span) + "\n" for span in batch))
+                    size = file.tell()
+                #keep one old file around, drop the rest
+                if size > TRACE_EXPORT_MAX_BYTES:
+                    os.replace(self.export_file, self.export_file + ".1")
+            except OSError:
+                pass
+
+        if TRACE_COLLECTOR_URL:
+            try:
+                requests.post(TRACE_COLLECTOR_URL, json={"spans": batch}, timeout=2)
+            except requests.RequestException:
+                pass
+
+    #the export files of all services together -> full cross-service picture
+    def exported_spans(self) -> List[dict]:
+        if not TRACE_EXPORT_FILE:
+            return []
+        spans = []
+        for path in glob.glob(export_file_for("*")):
+            #rotated files are history, only needed if the live one is lost
+            if path.endswith(".1"):
+                continue
+            spans.extend(read_span_tail(path))
+        return spans
+
+    #------------#
+    #   REPORT   #
+    #------------#
+
+    def slowest_traces(self, limit: int = 10) -> List[dict]:
+        with self.lock:
+            local = list(self.spans)
+
+        #dedupe: our own spans are in the buffer and (maybe) in the export file
+        by_id: Dict[str, dict] = {}
+        for span in self.exported_spans() + local:
+            by_id[span["spanId"]] = span
+
+        traces: Dict[str, List[dict]] = {}
+        for span in by_id.values():
+            traces.setdefault(span["traceId"], []).append(span)
+
+        flows = []
+        for trace_id, spans in traces.items():
+            spans.sort(key=lambda s: s["start"])
+            begin = spans[0]["start"]
+            end = max(s["start"] + s["durationMs"] / 1000 for s in spans)
+
+            per_service: Dict[str, float] = {}
+            for s in spans:
+                #only top level spans of a service, nested ones are already inside
+                parent_service = by_id.get(s["parentId"], {}).get("service")
+                if parent_service != s["service"]:
+                    per_service[s["service"]] = round(per_service.get(s["service"], 0) + s["durationMs"], 3)
+
+            flows.append({
+                "traceId":    trace_id,
+                "root":       spans[0]["name"],
+                "totalMs":    round((end - begin) * 1000, 3),
+                "services":   per_service,
+                "errors":     sum(1 for s in spans if s.get("error")),
+                "links":      sorted({link for s in spans for link in s.get("links", [])}),
+                "spans": [{
+                    "service":  s["service"],
+                    "name":     s["name"],
+                    "spanId":   s["spanId"],
+                    "parentId": s["parentId"],
+                    "offsetMs": round((s["start"] - begin) * 1000, 3),
+                    "durationMs": s["durationMs"],
+                    "attributes": s.get("attributes", {}),
+                    "error":    s.get("error"),
+                } for s in spans],
+            })
+
+        flows.sort(key=lambda f: f["totalMs"], reverse=True)
+        return flows[:limit]
+
+    #------------#
+    #  PROFILER  #
+    #------------#
+
+    def profile(self, seconds: float, interval_ms: float, limit: int) -> dict:
+        seconds = min(max(seconds, 0.1), PROFILE_MAX_SECONDS)
+        interval = max(interval_ms, PROFILE_MIN_INTERVAL_MS) / 1000
+        me = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+        stacks = Counter()
+        samples = 0
+        deadline = time.perf_counter() + seconds
+
+        while time.perf_counter() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == me:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+                #root first, like a flame graph line
+                stacks[(names.get(thread_id, str(thread_id)), ";".join(reversed(stack)))] += 1
+            samples += 1
+            time.sleep(interval)
+
+        return {
+            "service":  self.service,
+            "seconds":  seconds,
+            "samples":  samples,
+            "stacks": [{
+                "thread":   thread,
+                "count":    count,
+                "percent":  round(count * 100 / samples, 2) if samples else 0,
+                "stack":    stack,
+            } for (thread, stack), count in stacks.most_common(limit)],
+        }
+
+
+#wrap the whole app: one server span per HTTP request, traceparent echoed back
+#plain ASGI (not @app.middleware) so streaming responses are not buffered
+#`untraced(scope)` lets a service skip requests that are slow on purpose (long-poll, SSE),
+#otherwise they would always be the "slowest flow" in /debug/traces
+class TracingMiddleware:
+
+    def __init__(self, app, tracer: Tracer, untraced: Optional[Callable[[dict], bool]] = None):
+        self.app = app
+        self.tracer = tracer
+        self.untraced = untraced
+
+    async def __call__(self, scope, receive, send):
+        if (scope["type"] != "http" or scope["path"].startswith("/debug") or scope["path"] == "/health"
+                or (self.untraced and self.untraced(scope))):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        incoming = headers.get(b"traceparent", b"").decode("latin-1") or None
+        name = f"{scope['method']} {scope['path']}"
+
+        with self.tracer.span(name, traceparent=incoming) as span:
+            async def send_with_trace(message):
+                if message["type"] == "http.response.start":
+                    span["attributes"]["status"] = message["status"]
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [
+                        (b"traceparent", format_traceparent(span).encode("latin-1"))
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace)
+
+
+def install_tracing(app, service: str, untraced: Optional[Callable[[dict], bool]] = None) -> Tracer:
+    tracer = Tracer(service)
+    app.add_middleware(TracingMiddleware, tracer=tracer, untraced=untraced)
+
+    router = APIRouter()
+
+    @router.get("/debug/traces")
+    def debug_traces(limit: int = 10):
+        return {"service": service, "sampleRate": TRACE_SAMPLE_RATE,
+                "traces": tracer.slowest_traces(limit=limit)}
+
+    #runs in a worker thread so the event loop keeps serving (and gets sampled)
+    @router.get("/debug/profile")
+    async def debug_profile(seconds: float = 5, interval_ms: float = 10, limit: int = 20):
+        if not tracer.profile_lock.acquire(blocking=False):
+            raise HTTPException(status_code=409, detail="A profile is already running")
+
+        #released by the worker thread itself, it keeps running even if the client goes away
+        def run():
+            try:
+                return tracer.profile(seconds, interval_ms, limit)
+            finally:
+                tracer.profile_lock.release()
+
+        return await asyncio.to_thread(run)
+
+    app.include_router(router)
+    return tracer
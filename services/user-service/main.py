@@ -1,8 +1,15 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import Optional
+import os
+import sys
+
+#shared helpers live one folder up (services/)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tracing import install_tracing
 
 app = FastAPI()
+tracer = install_tracing(app, service="user-service")
 
 #in memory data set
 #key field: username